@@ -6,6 +6,15 @@ import type { FileFormat, ScreenshotOptions, ScreenshotResult } from './types.js
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
+// Formats whose templates only need the input as text. RTF is excluded since
+// it may carry 8-bit codepage bytes that must reach rtf.js untouched.
+const TEXT_FORMATS: ReadonlySet<FileFormat> = new Set<FileFormat>([
+  'md', 'html', 'csv', 'ipynb', 'tex', 'code', 'mmd', 'geojson', 'gpx',
+]);
+
+// Input handed to a template: raw text for text formats, base64 otherwise
+type InputData = { fileText: string } | { fileBase64: string };
+
 export class Renderer {
   private getTemplatePath(format: FileFormat): string {
     const templateMap: Record<FileFormat, string> = {
@@ -37,17 +46,17 @@ export class Renderer {
 
   private async injectDataIntoPage(
     page: Page,
-    fileBase64: string,
+    fileData: InputData,
     pageNumber: number = 1,
     fileName: string = ''
   ): Promise<void> {
     // Inject data into page globals before template loads
-    await page.addInitScript(({ fileBase64: fb64, pageNum, fName }: { fileBase64: string; pageNum: number; fName: string }) => {
+    await page.addInitScript(({ fileData: data, pageNum, fName }: { fileData: InputData; pageNum: number; fName: string }) => {
       // Override the placeholder values
-      (globalThis as unknown as Record<string, unknown>).fileBase64 = fb64;
+      Object.assign(globalThis, data);
       (globalThis as unknown as Record<string, unknown>).pageNumber = pageNum;
       (globalThis as unknown as Record<string, unknown>).fileName = fName;
-    }, { fileBase64, pageNum: pageNumber, fName: fileName });
+    }, { fileData, pageNum: pageNumber, fName: fileName });
   }
 
   async render(
@@ -114,17 +123,22 @@ export class Renderer {
         };
       }
 
-      // Encode input as base64
-      let fileBase64: string;
-      if (Buffer.isBuffer(input)) {
-        fileBase64 = input.toString('base64');
+      let fileData: InputData;
+      if (TEXT_FORMATS.has(format)) {
+        // Text formats get their content as a string, skipping the base64 round-trip
+        fileData = {
+          fileText: Buffer.isBuffer(input) ? input.toString('utf-8') : input,
+        };
+      } else if (Buffer.isBuffer(input)) {
+        // Encode input as base64
+        fileData = { fileBase64: input.toString('base64') };
       } else {
         // String input for non-URL formats is treated as text content
-        fileBase64 = Buffer.from(input, 'utf-8').toString('base64');
+        fileData = { fileBase64: Buffer.from(input, 'utf-8').toString('base64') };
       }
 
       // Inject data before loading template
-      await this.injectDataIntoPage(page, fileBase64, pageNumber, fileName);
+      await this.injectDataIntoPage(page, fileData, pageNumber, fileName);
 
       // Load template
       const templatePath = this.getTemplatePath(format);
@@ -4,13 +4,23 @@ ScreenItShot - Convert various file formats to high-quality screenshots
 Self-contained Python package using Playwright for browser-based rendering.
 """
 
+import os
+import io
 import base64
+import json
+import atexit
 import asyncio
+import functools
+import zipfile
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Literal, Union
+from typing import Any, AsyncIterator, Optional, Literal, Union
 from dataclasses import dataclass
 
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, Browser, BrowserContext, Error as PlaywrightError, Page, Playwright, Route
+
+from . import _loop_thread
 
 
 __version__ = "0.5.0"
@@ -65,6 +75,155 @@ SLUG_TO_FORMAT: dict[str, FileFormat] = {
     "gpx": "gpx",
 }
 
+# Mapping from file extensions to FileFormat
+_EXTENSION_MAP: dict[str, FileFormat] = {
+    # Document formats
+    ".pdf": "pdf",
+    ".epub": "epub",
+    ".docx": "docx",
+    ".xlsx": "xlsx",
+    ".pptx": "pptx",
+    # Text formats
+    ".md": "md",
+    ".markdown": "md",
+    ".html": "html",
+    ".htm": "html",
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".rtf": "rtf",
+    ".ipynb": "ipynb",
+    ".tex": "tex",
+    ".latex": "tex",
+    # Source code extensions
+    ".js": "code",
+    ".jsx": "code",
+    ".ts": "code",
+    ".tsx": "code",
+    ".py": "code",
+    ".rb": "code",
+    ".java": "code",
+    ".c": "code",
+    ".cpp": "code",
+    ".cc": "code",
+    ".cxx": "code",
+    ".h": "code",
+    ".hpp": "code",
+    ".cs": "code",
+    ".go": "code",
+    ".rs": "code",
+    ".swift": "code",
+    ".kt": "code",
+    ".kts": "code",
+    ".scala": "code",
+    ".php": "code",
+    ".sh": "code",
+    ".bash": "code",
+    ".zsh": "code",
+    ".fish": "code",
+    ".ps1": "code",
+    ".sql": "code",
+    ".json": "code",
+    ".yaml": "code",
+    ".yml": "code",
+    ".xml": "code",
+    ".css": "code",
+    ".scss": "code",
+    ".sass": "code",
+    ".less": "code",
+    ".vue": "code",
+    ".svelte": "code",
+    ".r": "code",
+    ".lua": "code",
+    ".perl": "code",
+    ".pl": "code",
+    ".ex": "code",
+    ".exs": "code",
+    ".erl": "code",
+    ".hs": "code",
+    ".ml": "code",
+    ".fs": "code",
+    ".fsx": "code",
+    ".clj": "code",
+    ".cljs": "code",
+    ".dart": "code",
+    ".zig": "code",
+    ".nim": "code",
+    ".v": "code",
+    ".toml": "code",
+    ".ini": "code",
+    ".conf": "code",
+    ".graphql": "code",
+    ".gql": "code",
+    ".proto": "code",
+    ".tf": "code",
+    ".hcl": "code",
+    ".asm": "code",
+    ".s": "code",
+    ".diff": "code",
+    ".patch": "code",
+    ".mdx": "code",
+    ".astro": "code",
+    # URL file extension
+    ".url": "url",
+    # Mermaid diagram extension
+    ".mmd": "mmd",
+    ".mermaid": "mmd",
+    # GeoJSON extension
+    ".geojson": "geojson",
+    # GPX extension
+    ".gpx": "gpx",
+}
+
+# Leading four magic bytes, as big-endian integers. "zip" marks ZIP containers,
+# which need a closer look to tell epub, docx, xlsx and pptx apart
+_MAGIC_U32: dict[int, str] = {
+    0x25504446: "pdf",  # "%PDF"
+    0x504B0304: "zip",  # "PK\x03\x04" local file header
+    0x504B0506: "zip",  # "PK\x05\x06" empty archive
+    0x504B0708: "zip",  # "PK\x07\x08" spanned archive
+    0x7B5C7274: "rtf",  # "{\rt", confirmed by the "f" that follows
+}
+
+# Bytes read for magic detection - enough to reach an EPUB's mimetype entry and
+# the root element of a short XML prolog
+_MAGIC_READ_SIZE = 64
+
+# First entry of an EPUB container: the file name "mimetype" and its stored content
+_EPUB_MIMETYPE_ENTRY = b"mimetypeapplication/epub+zip"
+
+# Main part of each Office Open XML package, used to tell ZIP-based formats apart
+_OOXML_MAIN_PARTS: tuple[tuple[str, FileFormat], ...] = (
+    ("word/document.xml", "docx"),
+    ("xl/workbook.xml", "xlsx"),
+    ("ppt/presentation.xml", "pptx"),
+)
+
+# Mapping from Magika content-type labels to FileFormat, for files whose
+# extension and magic bytes are both inconclusive
+_MAGIKA_LABEL_TO_FORMAT: dict[str, FileFormat] = {
+    "pdf": "pdf",
+    "epub": "epub",
+    "docx": "docx",
+    "xlsx": "xlsx",
+    "pptx": "pptx",
+    "markdown": "md",
+    "html": "html",
+    "csv": "csv",
+    "tsv": "csv",
+    "rtf": "rtf",
+    "latex": "tex",
+    **{label: "code" for label in (
+        "asm", "c", "clojure", "cpp", "cs", "css", "dart", "diff", "erlang",
+        "go", "groovy", "haskell", "hcl", "ini", "java", "javascript", "json",
+        "kotlin", "less", "lua", "ocaml", "perl", "php", "powershell", "proto",
+        "python", "r", "ruby", "rust", "scala", "scss", "shell", "sql", "swift",
+        "toml", "typescript", "vue", "xml", "yaml", "zig",
+    )},
+}
+
+# Lazily loaded Magika model - None until first use, False if unavailable
+_magika: Any = None
+
 # Template directory - use render/dist in dev, bundled templates in installed package
 _DEV_TEMPLATES_DIR = Path(__file__).parent.parent.parent / "render" / "dist"
 _INSTALLED_TEMPLATES_DIR = Path(__file__).parent / "templates"
@@ -72,6 +231,101 @@ _INSTALLED_TEMPLATES_DIR = Path(__file__).parent / "templates"
 # Prefer dev path if it exists (for local development)
 TEMPLATES_DIR = _DEV_TEMPLATES_DIR if _DEV_TEMPLATES_DIR.exists() else _INSTALLED_TEMPLATES_DIR
 
+# Available templates by format, found once at import - templates don't change at runtime
+_TEMPLATE_PATHS: dict[str, Path] = {path.stem: path for path in TEMPLATES_DIR.glob("*.html")}
+
+# Templates are loaded from this origin, and fetch() the input file from it.
+# Requests to it are fulfilled from memory by a Playwright route, so they never
+# touch the network, templates are read from disk once, and input bytes skip
+# the base64 round-trip. Any other request to it is aborted. The reserved
+# .invalid TLD guarantees the name can never resolve
+_ORIGIN_URL = "http://screenitshot.invalid"
+_INPUT_URL = f"{_ORIGIN_URL}/__input__"
+
+# Script registered once per template context (not for URL renders): globals
+# that are the same for every render, plus a stylesheet that turns off CSS
+# animations and transitions so pages settle immediately and captures are
+# deterministic
+_CONTEXT_INIT_JS = f"""
+globalThis.fileUrl = {json.dumps(_INPUT_URL)};
+(() => {{
+    const style = document.createElement("style");
+    style.textContent = "*, *::before, *::after {{ animation: none !important; transition: none !important; }}";
+    const inject = () => (document.head || document.documentElement).appendChild(style);
+    if (document.documentElement) {{
+        inject();
+    }} else {{
+        document.addEventListener("DOMContentLoaded", inject, {{ once: true }});
+    }}
+}})();
+"""
+
+# Chromium flags for headless capture. --disable-gpu is left out on purpose
+# since the geojson/gpx templates render their maps with WebGL.
+_CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-extensions",
+    "--disable-features=TranslateUI",
+    "--mute-audio",
+    "--hide-scrollbars",
+]
+
+# How long a template may take to fire its load event, matching Playwright's
+# default navigation timeout
+_TEMPLATE_LOAD_TIMEOUT_MS = 30000
+
+# Returns the template's renderComplete promise, which Playwright awaits in the
+# same Runtime.evaluate call. It is sent as soon as navigation commits and waits
+# for the load event in the page, so the call overlaps template loading instead
+# of costing a round-trip after goto() returns. The load wait keeps goto()'s
+# timeout (resolving null when it expires); rendering itself is not bounded
+_RENDER_COMPLETE_JS = """async (loadTimeoutMs) => {
+    if (document.readyState !== 'complete') {
+        const loaded = await new Promise(resolve => {
+            window.addEventListener('load', () => resolve(true), { once: true });
+            setTimeout(() => resolve(false), loadTimeoutMs);
+        });
+        if (!loaded) {
+            return null;
+        }
+    }
+    const renderComplete = globalThis.renderComplete;
+    if (!renderComplete) {
+        throw new Error('window.renderComplete not found');
+    }
+    return renderComplete;
+}"""
+
+# Resolves once the next frame has been painted - two nested rAFs, since the
+# first callback runs before that frame's layout and paint
+_WAIT_LAYOUT_JS = "() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))"
+
+# Run before a raw CDP capture: waits for web fonts as page.screenshot() does,
+# and returns the scroll offset that viewport-relative clips are shifted by
+_CAPTURE_PREPARE_JS = """async () => {
+    await document.fonts.ready;
+    return { x: window.scrollX, y: window.scrollY };
+}"""
+
+# Browser pool settings - number of Chromium instances kept warm, and how many
+# screenshots each one takes before it is closed and replaced
+BROWSER_POOL_SIZE = int(os.environ.get("SCREENITSHOT_BROWSER_POOL_SIZE", "4"))
+BROWSER_POOL_RECYCLE_AFTER = int(os.environ.get("SCREENITSHOT_BROWSER_POOL_RECYCLE_AFTER", "100"))
+
+# Chromium serializes screenshot capture per browser (the captured tab is
+# brought to front), so each pooled browser serves one render at a time.
+# Size the pool to the expected concurrency.
+CONCURRENT_SCREENSHOTS_PER_BROWSER = 1
+
+# Idle BrowserContexts kept per browser for reuse, across all viewport sizes
+IDLE_CONTEXTS_PER_BROWSER = 4
+
+# Contexts are reused only for the same initial viewport
+_ContextKey = tuple[int, int, int]  # (width, height, device_scale_factor)
+
 
 @dataclass
 class ScreenshotResult:
@@ -88,6 +342,367 @@ class ScreenitshotError(Exception):
     pass
 
 
+# Queued by _BrowserPool.close() to wake callers waiting for a browser
+_POOL_CLOSED = object()
+
+
+class _BrowserPool:
+    """Pool of long-lived Chromium browsers shared by render_async calls.
+
+    Playwright is started on first use and browsers are launched lazily, up to
+    ``size`` instances. Each browser is closed and replaced after
+    ``recycle_after`` uses to cap native memory drift. A None in the idle queue
+    is a slot whose browser failed to launch; whoever takes it launches anew.
+
+    Each start of the pool gets a new idle queue, which also serves as its
+    generation: browsers checked in against an older queue are closed instead
+    of being handed out again.
+    """
+
+    def __init__(self, size: int, recycle_after: int):
+        self.size = max(1, size)
+        self.recycle_after = max(1, recycle_after)
+        self._playwright: Optional[Playwright] = None
+        # Idle browsers, None for free slots, or _POOL_CLOSED to wake waiters
+        self._idle: Optional["asyncio.Queue[Any]"] = None
+        self._lock: Optional[asyncio.Lock] = None
+        # Set while warm() is launching the first browser
+        self._warming: Optional[asyncio.Event] = None
+        self._uses: dict[Browser, int] = {}
+        self._launched = 0
+        # Idle contexts per browser, keyed by (width, height, device_scale_factor)
+        # in least-recently-used order
+        self._contexts: dict[Browser, "OrderedDict[_ContextKey, list[BrowserContext]]"] = {}
+
+    async def _start(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+                self._idle = asyncio.Queue()
+
+    async def _launch(self) -> Browser:
+        assert self._playwright is not None
+        browser = await self._playwright.chromium.launch(headless=True, args=_CHROMIUM_ARGS)
+        self._uses[browser] = 0
+        return browser
+
+    def _free_slot(self, idle: "asyncio.Queue[Any]") -> None:
+        """Hand a slot left without a browser to the next caller.
+
+        Callers may already be waiting on the idle queue, so the slot is queued
+        rather than just uncounted. Slots of a closed pool are dropped.
+        """
+        if idle is self._idle:
+            idle.put_nowait(None)
+
+    async def _replace(self, browser: Browser, idle: "asyncio.Queue[Any]") -> Optional[Browser]:
+        """Close a browser and launch a new one in its slot.
+
+        Returns None (and frees the slot) if the replacement fails to launch.
+        """
+        self._uses.pop(browser, None)
+        self._contexts.pop(browser, None)
+        try:
+            await browser.close()
+        except Exception:
+            pass
+        try:
+            return await self._launch()
+        except Exception:
+            self._free_slot(idle)
+            return None
+
+    async def _checkout(self) -> tuple[Browser, "asyncio.Queue[Any]"]:
+        """Take or launch a browser, along with the idle queue it belongs to"""
+        await self._start()
+
+        # Let an in-flight warm-up finish first, so its browser serves this
+        # render instead of a second one being launched
+        if self._warming is not None:
+            await self._warming.wait()
+
+        idle = self._idle
+        if idle is None:
+            raise ScreenitshotError("Browser pool was closed")
+
+        # Launch a new browser while there is spare capacity, otherwise wait
+        # for one to be returned
+        if idle.empty() and self._launched < self.size:
+            self._launched += 1
+            try:
+                return await self._launch(), idle
+            except BaseException:
+                self._free_slot(idle)
+                raise
+
+        browser = await idle.get()
+        if browser is _POOL_CLOSED:
+            # Pass the wake-up on to the next waiter
+            idle.put_nowait(browser)
+            raise ScreenitshotError("Browser pool was closed")
+        if browser is None:
+            # Slot freed by a failed launch
+            try:
+                return await self._launch(), idle
+            except BaseException:
+                self._free_slot(idle)
+                raise
+        if not browser.is_connected():
+            replacement = await self._replace(browser, idle)
+            if replacement is None:
+                raise ScreenitshotError("Failed to relaunch pooled browser")
+            browser = replacement
+        return browser, idle
+
+    async def _checkin(self, browser: Browser, idle: "asyncio.Queue[Any]") -> None:
+        if idle is not self._idle:
+            # Pool was closed (and possibly restarted) while the browser was
+            # checked out, so it belongs to an older generation
+            self._uses.pop(browser, None)
+            self._contexts.pop(browser, None)
+            try:
+                await browser.close()
+            except Exception:
+                pass
+            return
+
+        self._uses[browser] = self._uses.get(browser, 0) + 1
+        if self._uses[browser] >= self.recycle_after or not browser.is_connected():
+            replacement = await self._replace(browser, idle)
+            if replacement is None:
+                return
+            browser = replacement
+        idle.put_nowait(browser)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Browser]:
+        """Check out a browser for the duration of the ``async with`` block.
+
+        Checkout is exclusive (CONCURRENT_SCREENSHOTS_PER_BROWSER = 1):
+        concurrent callers get different browsers, and wait for one to be
+        returned once all ``size`` browsers are busy. Callers should open
+        pages through new_page() rather than closing the browser.
+        """
+        browser, idle = await self._checkout()
+        try:
+            yield browser
+        finally:
+            await self._checkin(browser, idle)
+
+    @asynccontextmanager
+    async def new_page(
+        self,
+        browser: Browser,
+        width: int,
+        height: int,
+        device_scale_factor: int,
+        reuse: bool = True,
+    ) -> AsyncIterator[Page]:
+        """Open a page with the given viewport on a checked-out browser.
+
+        With ``reuse``, the page's context is taken from (and returned to) the
+        browser's idle contexts with the same viewport. Before it goes back,
+        its pages are closed and its cookies and origin storage wiped, since
+        templates run script from the rendered documents. Contexts are
+        discarded if the render fails, cannot be reset, or
+        ``reuse`` is off. Without ``reuse`` the context is also left plain,
+        without _CONTEXT_INIT_JS, since it serves a real website (URL renders).
+        """
+        key = (width, height, device_scale_factor)
+        context = self._take_context(browser, key) if reuse else None
+        if context is None:
+            context = await self._new_context(browser, key, template=reuse)
+
+        keep = False
+        try:
+            page = await context.new_page()
+            yield page
+            keep = reuse and browser.is_connected()
+        finally:
+            if keep:
+                try:
+                    await self._reset_context(context, page)
+                except Exception:
+                    keep = False
+            if keep:
+                await self._put_context(browser, key, context)
+            else:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+    async def _reset_context(self, context: BrowserContext, page: Page) -> None:
+        """Leave nothing from a render behind in a context that will be reused"""
+        # Popups opened by the document
+        await asyncio.gather(*(other.close() for other in context.pages if other is not page))
+
+        cdp = await context.new_cdp_session(page)
+        try:
+            await asyncio.gather(
+                context.clear_cookies(),
+                cdp.send("Storage.clearDataForOrigin", {"origin": _ORIGIN_URL, "storageTypes": "all"}),
+            )
+        finally:
+            await cdp.detach()
+
+        # Closing the page drops its per-call routes and init script
+        await page.close()
+
+    async def _new_context(self, browser: Browser, key: _ContextKey, template: bool = True) -> BrowserContext:
+        width, height, device_scale_factor = key
+        context = await browser.new_context(
+            viewport={"width": width, "height": height},
+            device_scale_factor=device_scale_factor,
+        )
+        if not template:
+            return context
+        try:
+            await context.add_init_script(_CONTEXT_INIT_JS)
+        except Exception:
+            await context.close()
+            raise
+        return context
+
+    def _take_context(self, browser: Browser, key: _ContextKey) -> Optional[BrowserContext]:
+        contexts = self._contexts.get(browser)
+        idle = contexts.get(key) if contexts else None
+        if not idle:
+            return None
+        context = idle.pop()
+        if not idle:
+            del contexts[key]
+        return context
+
+    async def _put_context(self, browser: Browser, key: _ContextKey, context: BrowserContext) -> None:
+        contexts = self._contexts.setdefault(browser, OrderedDict())
+        contexts.setdefault(key, []).append(context)
+        contexts.move_to_end(key)
+
+        # Evict from the least recently used viewport once over the limit
+        while sum(len(idle) for idle in contexts.values()) > IDLE_CONTEXTS_PER_BROWSER:
+            oldest_key, oldest = next(iter(contexts.items()))
+            evicted = oldest.pop(0)
+            if not oldest:
+                del contexts[oldest_key]
+            try:
+                await evicted.close()
+            except Exception:
+                pass
+
+    async def warm(self) -> None:
+        """Start Playwright and launch one browser ahead of the first render.
+
+        The browser also gets an idle context for the default document
+        viewport. Failures are ignored; the render that needs the browser
+        reports them.
+        """
+        if self._launched or self._warming is not None:
+            return
+
+        self._warming = warming = asyncio.Event()
+        try:
+            await self._start()
+            idle = self._idle
+            assert idle is not None
+
+            self._launched += 1
+            try:
+                browser = await self._launch()
+            except Exception:
+                self._free_slot(idle)
+                raise
+
+            try:
+                key = (800, 600, 1)
+                await self._put_context(browser, key, await self._new_context(browser, key))
+            except Exception:
+                pass
+
+            if idle is self._idle:
+                idle.put_nowait(browser)
+            else:
+                # Pool was closed while the browser was launching
+                await browser.close()
+        except Exception:
+            pass
+        finally:
+            self._warming = None
+            warming.set()
+
+    async def close(self) -> None:
+        """Close all idle browsers and stop Playwright."""
+        if self._playwright is None:
+            return
+
+        playwright, idle = self._playwright, self._idle
+        assert idle is not None
+        self._playwright = None
+        self._idle = None
+        self._uses.clear()
+        self._contexts.clear()
+        self._launched = 0
+
+        while not idle.empty():
+            browser = idle.get_nowait()
+            if browser is None:
+                continue
+            try:
+                await browser.close()
+            except Exception:
+                pass
+
+        # Wake callers waiting for a browser; each passes this on to the next
+        idle.put_nowait(_POOL_CLOSED)
+        await playwright.stop()
+
+
+_pool = _BrowserPool(BROWSER_POOL_SIZE, BROWSER_POOL_RECYCLE_AFTER)
+
+
+async def close_pool() -> None:
+    """Close all pooled browsers and stop Playwright.
+
+    This happens automatically at interpreter exit; call it to free the
+    browsers earlier.
+    """
+    if _loop_thread.is_running():
+        await _loop_thread.run_async(_pool.close())
+
+
+@atexit.register
+def _shutdown() -> None:
+    _loop_thread.stop(_pool.close)
+
+
+def _reset_pool_after_fork() -> None:
+    # The parent's browsers, Playwright driver and asyncio primitives belong to
+    # its background loop, which does not survive a fork. The child gets an
+    # empty pool and launches its own browsers on first use.
+    global _pool
+    _pool = _BrowserPool(BROWSER_POOL_SIZE, BROWSER_POOL_RECYCLE_AFTER)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
+# Start Playwright and a browser on the background loop as soon as the package
+# is imported, so the first render doesn't pay for the cold start. Set
+# SCREENITSHOT_NO_WARMUP=1 in scripts that may never take a screenshot.
+if not os.environ.get("SCREENITSHOT_NO_WARMUP"):
+    _loop_thread.submit(_pool.warm())
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_cached(format_str: str) -> Optional[FileFormat]:
+    """Memoized slug/MIME lookup, returning None for unknown formats"""
+    # Try slug first (more common), then MIME type
+    return SLUG_TO_FORMAT.get(format_str.lower()) or MIME_TO_FORMAT.get(format_str)
+
+
 def resolve_format(format_str: str) -> FileFormat:
     """Resolve a format string (MIME type or slug) to a FileFormat.
 
@@ -100,134 +715,100 @@ def resolve_format(format_str: str) -> FileFormat:
     Raises:
         ScreenitshotError: If format is not recognized
     """
-    # Try slug first (more common)
-    if format_str.lower() in SLUG_TO_FORMAT:
-        return SLUG_TO_FORMAT[format_str.lower()]
-
-    # Try MIME type
-    if format_str in MIME_TO_FORMAT:
-        return MIME_TO_FORMAT[format_str]
+    fmt = _resolve_cached(format_str)
+    if fmt is not None:
+        return fmt
 
     raise ScreenitshotError(f"Unknown format: {format_str}. Use a slug (e.g., 'pdf') or MIME type (e.g., 'application/pdf')")
 
 
 def detect_format(file_path: str) -> FileFormat:
     """Detect file format from extension and magic bytes"""
-    ext = Path(file_path).suffix.lower()
-
-    extension_map: dict[str, FileFormat] = {
-        # Document formats
-        ".pdf": "pdf",
-        ".epub": "epub",
-        ".docx": "docx",
-        ".xlsx": "xlsx",
-        ".pptx": "pptx",
-        # Text formats
-        ".md": "md",
-        ".markdown": "md",
-        ".html": "html",
-        ".htm": "html",
-        ".csv": "csv",
-        ".tsv": "csv",
-        ".rtf": "rtf",
-        ".ipynb": "ipynb",
-        ".tex": "tex",
-        ".latex": "tex",
-        # Source code extensions
-        ".js": "code",
-        ".jsx": "code",
-        ".ts": "code",
-        ".tsx": "code",
-        ".py": "code",
-        ".rb": "code",
-        ".java": "code",
-        ".c": "code",
-        ".cpp": "code",
-        ".cc": "code",
-        ".cxx": "code",
-        ".h": "code",
-        ".hpp": "code",
-        ".cs": "code",
-        ".go": "code",
-        ".rs": "code",
-        ".swift": "code",
-        ".kt": "code",
-        ".kts": "code",
-        ".scala": "code",
-        ".php": "code",
-        ".sh": "code",
-        ".bash": "code",
-        ".zsh": "code",
-        ".fish": "code",
-        ".ps1": "code",
-        ".sql": "code",
-        ".json": "code",
-        ".yaml": "code",
-        ".yml": "code",
-        ".xml": "code",
-        ".css": "code",
-        ".scss": "code",
-        ".sass": "code",
-        ".less": "code",
-        ".vue": "code",
-        ".svelte": "code",
-        ".r": "code",
-        ".lua": "code",
-        ".perl": "code",
-        ".pl": "code",
-        ".ex": "code",
-        ".exs": "code",
-        ".erl": "code",
-        ".hs": "code",
-        ".ml": "code",
-        ".fs": "code",
-        ".fsx": "code",
-        ".clj": "code",
-        ".cljs": "code",
-        ".dart": "code",
-        ".zig": "code",
-        ".nim": "code",
-        ".v": "code",
-        ".toml": "code",
-        ".ini": "code",
-        ".conf": "code",
-        ".graphql": "code",
-        ".gql": "code",
-        ".proto": "code",
-        ".tf": "code",
-        ".hcl": "code",
-        ".asm": "code",
-        ".s": "code",
-        ".diff": "code",
-        ".patch": "code",
-        ".mdx": "code",
-        ".astro": "code",
-        # URL file extension
-        ".url": "url",
-        # Mermaid diagram extension
-        ".mmd": "mmd",
-        ".mermaid": "mmd",
-        # GeoJSON extension
-        ".geojson": "geojson",
-        # GPX extension
-        ".gpx": "gpx",
-    }
+    ext = os.path.splitext(file_path)[1].lower()
+
+    fmt = _EXTENSION_MAP.get(ext)
+    if fmt is not None:
+        return fmt
+
+    # Fallback: check magic bytes. A raw fd read skips the buffered-IO setup
+    # that open() does just to read a few bytes
+    try:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            magic = os.read(fd, _MAGIC_READ_SIZE)
+        finally:
+            os.close(fd)
+    except OSError:
+        return "unknown"
+
+    # Look up the leading bytes as a single big-endian uint32
+    fmt = _MAGIC_U32.get(int.from_bytes(magic[:4], "big")) if len(magic) >= 4 else None
+    if fmt == "zip":
+        # EPUB requires an uncompressed "mimetype" first entry, whose name
+        # and content directly follow the 30-byte local file header
+        if magic[30:58] == _EPUB_MIMETYPE_ENTRY:
+            return "epub"
+        return _detect_zip_format(file_path)
+    if fmt == "rtf":
+        # The full signature is "{\rtf"; only the first four bytes fit the key
+        if magic[4:5] == b"f":
+            return "rtf"
+    elif fmt is not None:
+        return fmt
+
+    # Markup, ignoring a UTF-8 BOM, leading whitespace and case
+    head = magic[3:] if magic.startswith(b"\xef\xbb\xbf") else magic
+    head = head.lstrip().lower()
+    if head.startswith((b"<!doctype html", b"<html")):
+        return "html"
+    if head.startswith(b"<?xml"):
+        return "gpx" if b"<gpx" in head else "code"
+
+    return _detect_magika(file_path)
+
+
+def _detect_magika(file_path: str) -> FileFormat:
+    """Identify content with Magika's model, if the optional package is installed"""
+    global _magika
+    if _magika is None:
+        try:
+            from magika import Magika
+            _magika = Magika()
+        except Exception:
+            _magika = False
+    if not _magika:
+        return "unknown"
 
-    if ext in extension_map:
-        return extension_map[ext]
+    try:
+        output = _magika.identify_path(Path(file_path)).output
+    except Exception:
+        return "unknown"
+    # Newer Magika releases name the field "label", older ones "ct_label"
+    label = getattr(output, "label", None) or getattr(output, "ct_label", None)
+    return _MAGIKA_LABEL_TO_FORMAT.get(str(label), "unknown")
 
-    # Fallback: check magic bytes
+
+def _detect_zip_format(file_path: str) -> FileFormat:
+    """Tell ZIP-based formats apart by the parts listed in the central directory"""
     try:
-        with open(file_path, "rb") as f:
-            magic = f.read(4)
-            if magic[:4] == b"%PDF":
-                return "pdf"
-            if magic[:2] == b"PK":  # ZIP-based (could be epub, docx, xlsx, pptx)
-                return "epub"  # Default to epub for ZIP
+        with zipfile.ZipFile(file_path) as zf:
+            names = set(zf.namelist())
     except Exception:
-        pass
+        return "epub"  # Default to epub for ZIP
+
+    if "[Content_Types].xml" in names:
+        for part, fmt in _OOXML_MAIN_PARTS:
+            if part in names:
+                return fmt
+    return "epub"
+
 
-    return "unknown"
+def _build_init_script(page: int, file_name: str) -> str:
+    """Build the script that passes per-call render parameters to the template page."""
+    return "".join((
+        "globalThis.pageNumber = ", str(int(page)), ";\n",
+        "globalThis.fileName = ", json.dumps(file_name), ";\n",
+    ))
 
 
 def get_template_path(format: FileFormat) -> Path:
@@ -235,8 +816,9 @@ def get_template_path(format: FileFormat) -> Path:
     if format == "unknown":
         raise ScreenitshotError(f"No template available for format: {format}")
 
-    template_path = TEMPLATES_DIR / f"{format}.html"
-    if not template_path.exists():
+    template_path = _TEMPLATE_PATHS.get(format)
+    if template_path is None:
+        template_path = TEMPLATES_DIR / f"{format}.html"
         raise ScreenitshotError(
             f"Template not found: {template_path}. "
             "Ensure templates are installed with the package."
@@ -244,8 +826,86 @@ def get_template_path(format: FileFormat) -> Path:
     return template_path
 
 
+def _png_to_webp(png_data: bytes) -> bytes:
+    """Re-encode a PNG screenshot as WebP using Pillow's libwebp binding"""
+    try:
+        from PIL import Image
+    except ImportError as e:
+        raise ScreenitshotError(
+            "WebP output requires Pillow. Install it with: pip install 'screenitshot[webp]'"
+        ) from e
+
+    output = io.BytesIO()
+    with Image.open(io.BytesIO(png_data)) as img:
+        img.save(output, "webp", quality=85, method=4)
+    return output.getvalue()
+
+
+@functools.lru_cache(maxsize=32)
+def _read_template(format: FileFormat) -> bytes:
+    """Read a template's HTML once and keep it in memory"""
+    return get_template_path(format).read_bytes()
+
+
+async def _capture_webp_cdp(page_obj: Page, clip: Optional[dict] = None) -> bytes:
+    """Let Chromium encode a WebP screenshot directly via CDP.
+
+    Follows page.screenshot(): fonts are awaited, the clip is relative to the
+    viewport, and content beyond the viewport is only captured when the clip
+    does not fit in it.
+    """
+    scroll = await page_obj.evaluate(_CAPTURE_PREPARE_JS)
+
+    params: dict[str, Any] = {"format": "webp", "quality": 85}
+    if clip is not None:
+        params["clip"] = {
+            "x": clip["x"] + scroll["x"],
+            "y": clip["y"] + scroll["y"],
+            "width": clip["width"],
+            "height": clip["height"],
+            "scale": 1,
+        }
+        viewport = page_obj.viewport_size
+        fits_viewport = viewport is not None and (
+            clip["x"] >= 0
+            and clip["y"] >= 0
+            and clip["x"] + clip["width"] <= viewport["width"]
+            and clip["y"] + clip["height"] <= viewport["height"]
+        )
+        params["captureBeyondViewport"] = not fits_viewport
+
+    cdp = await page_obj.context.new_cdp_session(page_obj)
+    try:
+        result = await cdp.send("Page.captureScreenshot", params)
+    finally:
+        await cdp.detach()
+    return base64.b64decode(result["data"])
+
+
+async def _capture(page_obj: Page, format: ImageFormat, **kwargs: Any) -> bytes:
+    """Take a screenshot in the requested image format.
+
+    Playwright only exposes PNG and JPEG screenshots, so WebP is requested
+    from Chromium over CDP. If the browser rejects that, it is captured as PNG
+    and re-encoded with Pillow in a worker thread.
+    """
+    if format != "webp":
+        return await page_obj.screenshot(type=format, **kwargs)
+
+    try:
+        return await _capture_webp_cdp(page_obj, kwargs.get("clip"))
+    except PlaywrightError as e:
+        cdp_error = e
+
+    png_data = await page_obj.screenshot(type="png", **kwargs)
+    try:
+        return await asyncio.to_thread(_png_to_webp, png_data)
+    except ScreenitshotError as e:
+        raise ScreenitshotError(f"{e} (native WebP capture failed: {cdp_error.message})") from cdp_error
+
+
 async def render_async(
-    input: Union[bytes, str],
+    input: Union[bytes, str, os.PathLike],
     input_format: str,
     *,
     format: ImageFormat = "png",
@@ -253,18 +913,20 @@ async def render_async(
     height: Optional[int] = None,
     page: int = 1,
     file_name: Optional[str] = None,
+    device_scale_factor: int = 1,
 ) -> ScreenshotResult:
     """
     Async implementation of screenshot rendering.
 
     Args:
-        input: Input data - bytes for documents, or URL string for 'url' format
+        input: Input data - bytes for documents, URL string for 'url' format, or a path to read the input from
         input_format: Input format as slug (e.g., 'pdf') or MIME type (e.g., 'application/pdf')
         format: Output image format ('png', 'jpeg', 'webp')
         width: Viewport width (optional, defaults to 800 or 1280 for URLs)
         height: Viewport height (optional, defaults to 600 or 800 for URLs)
         page: Page number for multi-page documents
         file_name: Optional filename hint for code format language detection
+        device_scale_factor: Device pixel ratio (2 for retina-quality output, at 4x the pixels to render and encode)
 
     Returns:
         ScreenshotResult with image data and dimensions
@@ -272,156 +934,175 @@ async def render_async(
     Raises:
         ScreenitshotError: If conversion fails
     """
+    # The browser pool lives on the background loop - hop over to it when
+    # called from any other loop
+    if asyncio.get_running_loop() is not _loop_thread.get_loop():
+        return await _loop_thread.run_async(render_async(
+            input, input_format, format=format, width=width, height=height,
+            page=page, file_name=file_name, device_scale_factor=device_scale_factor,
+        ))
+
     # Resolve format string to FileFormat
     file_format = resolve_format(input_format)
 
-    # Use small initial viewport - content will determine final size
-    initial_width = width or 800
-    initial_height = height or 600
+    # Read input files off the event loop so concurrent renders keep progressing
+    if isinstance(input, os.PathLike):
+        try:
+            input = await asyncio.to_thread(Path(input).read_bytes)
+        except OSError as e:
+            raise ScreenitshotError(f"Failed to read input file: {e}") from e
+
+    if file_format == "url":
+        # Set a reasonable viewport for webpage screenshots
+        initial_width = width or 1280
+        initial_height = height or 800
+    else:
+        # Use small initial viewport - content will determine final size
+        initial_width = width or 800
+        initial_height = height or 600
+
+    # Contexts are reused across renders with the same initial viewport, except
+    # for URLs, which get a fresh context so cookies and storage don't leak
+    # between sites
+    async with _pool.acquire() as browser, _pool.new_page(
+        browser,
+        initial_width,
+        initial_height,
+        device_scale_factor,
+        reuse=file_format != "url",
+    ) as page_obj:
+        # Special handling for URL format - navigate directly to the URL
+        if file_format == "url":
+            # Input should be a URL string
+            if isinstance(input, bytes):
+                url = input.decode("utf-8").strip()
+            else:
+                url = input.strip()
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+            # Navigate to URL and wait for network idle
+            await page_obj.goto(url, wait_until="networkidle")
 
-        try:
-            # Use deviceScaleFactor for high-quality rendering (2x = retina quality)
-            device_scale_factor = 2
+            # Take screenshot to buffer
+            screenshot_data = await _capture(
+                page_obj,
+                format,
+                full_page=False,
+            )
 
-            context = await browser.new_context(
-                viewport={"width": initial_width, "height": initial_height},
-                device_scale_factor=device_scale_factor,
+            return ScreenshotResult(
+                data=screenshot_data,
+                format=format,
+                width=initial_width * device_scale_factor,
+                height=initial_height * device_scale_factor,
+                renderer=file_format,
             )
-            page_obj = await context.new_page()
-
-            # Special handling for URL format - navigate directly to the URL
-            if file_format == "url":
-                # Input should be a URL string
-                if isinstance(input, bytes):
-                    url = input.decode("utf-8").strip()
-                else:
-                    url = input.strip()
-
-                # Set a reasonable viewport for webpage screenshots
-                web_width = width or 1280
-                web_height = height or 800
-                await page_obj.set_viewport_size({"width": web_width, "height": web_height})
-
-                # Navigate to URL and wait for network idle
-                await page_obj.goto(url, wait_until="networkidle")
-
-                # Take screenshot to buffer
-                screenshot_data = await page_obj.screenshot(
-                    type=format if format != "webp" else "png",
-                    full_page=False,
+
+        template_url = f"{_ORIGIN_URL}/{file_format}.html"
+        template_html = _read_template(file_format)
+
+        if isinstance(input, str):
+            # For non-URL formats, string input is treated as text content
+            input_bytes = input.encode("utf-8")
+        else:
+            input_bytes = input
+
+        # Serve the template and the raw input for its fetch() from memory
+        async def _serve(route: Route) -> None:
+            url = route.request.url
+            if url == template_url:
+                await route.fulfill(body=template_html, content_type="text/html; charset=utf-8")
+            elif url == _INPUT_URL:
+                await route.fulfill(
+                    body=input_bytes,
+                    content_type="application/octet-stream",
                 )
+            else:
+                # Relative links in rendered content (e.g. md/html images)
+                # resolve to this origin; fail them at once, as under file://
+                await route.abort()
+
+        # Use provided filename or default
+        fname = file_name or ""
+
+        # Register the route and inject data before loading template. These are
+        # independent, so their driver round-trips overlap.
+        await asyncio.gather(
+            page_obj.route(f"{_ORIGIN_URL}/**", _serve),
+            page_obj.add_init_script(_build_init_script(page, fname)),
+        )
 
-                await browser.close()
+        # Load template; the render-complete wait below covers the load event
+        await page_obj.goto(template_url, wait_until="commit")
 
-                return ScreenshotResult(
-                    data=screenshot_data,
-                    format=format,
-                    width=web_width * device_scale_factor,
-                    height=web_height * device_scale_factor,
-                    renderer=file_format,
-                )
+        # Wait for render complete and get metadata
+        metadata = await page_obj.evaluate(_RENDER_COMPLETE_JS, _TEMPLATE_LOAD_TIMEOUT_MS)
+        if metadata is None:
+            raise ScreenitshotError(
+                f"Template did not finish loading within {_TEMPLATE_LOAD_TIMEOUT_MS / 1000:g}s"
+            )
 
-            # Get template
-            template_path = get_template_path(file_format)
+        # Check if we need to clip (for EPUB content cropping)
+        clip_x = metadata.get("clipX")
+        clip_y = metadata.get("clipY")
 
-            # Encode input as base64
-            if isinstance(input, str):
-                # For non-URL formats, string input is treated as text content
-                input_bytes = input.encode("utf-8")
-            else:
-                input_bytes = input
-            file_base64 = base64.b64encode(input_bytes).decode("ascii")
-
-            # Use provided filename or default
-            fname = file_name or ""
-
-            # Inject data before loading template
-            await page_obj.add_init_script(f"""
-                globalThis.fileBase64 = {repr(file_base64)};
-                globalThis.pageNumber = {page};
-                globalThis.fileName = {repr(fname)};
-            """)
-
-            # Load template
-            await page_obj.goto(f"file://{template_path}")
-
-            # Wait for render complete and get metadata
-            metadata = await page_obj.evaluate("""
-                async () => {
-                    const renderComplete = globalThis.renderComplete;
-                    if (!renderComplete) {
-                        throw new Error('window.renderComplete not found');
-                    }
-                    return await renderComplete;
-                }
-            """)
-
-            # Check if we need to clip (for EPUB content cropping)
-            clip_x = metadata.get("clipX")
-            clip_y = metadata.get("clipY")
-
-            if clip_x is not None and clip_y is not None:
-                # Resize viewport to ensure clip area is fully visible
-                required_width = clip_x + metadata["width"]
-                required_height = clip_y + metadata["height"]
+        if clip_x is not None and clip_y is not None:
+            # Resize viewport to ensure clip area is fully visible
+            viewport_width = max(clip_x + metadata["width"], initial_width)
+            viewport_height = max(clip_y + metadata["height"], initial_height)
+            if (viewport_width, viewport_height) != (initial_width, initial_height):
                 await page_obj.set_viewport_size({
-                    "width": max(required_width, initial_width),
-                    "height": max(required_height, initial_height),
+                    "width": viewport_width,
+                    "height": viewport_height,
                 })
 
                 # Wait for layout to stabilize
-                await page_obj.wait_for_timeout(100)
-
-                # Use clip to capture just the content area
-                screenshot_data = await page_obj.screenshot(
-                    type=format if format != "webp" else "png",
-                    clip={
-                        "x": clip_x,
-                        "y": clip_y,
-                        "width": metadata["width"],
-                        "height": metadata["height"],
-                    },
-                )
-            else:
-                # Resize viewport to match actual rendered content
+                await page_obj.evaluate(_WAIT_LAYOUT_JS)
+
+            # Use clip to capture just the content area
+            screenshot_data = await _capture(
+                page_obj,
+                format,
+                clip={
+                    "x": clip_x,
+                    "y": clip_y,
+                    "width": metadata["width"],
+                    "height": metadata["height"],
+                },
+            )
+        else:
+            # Resize viewport to match actual rendered content, unless it
+            # already does
+            if (metadata["width"], metadata["height"]) != (initial_width, initial_height):
                 await page_obj.set_viewport_size({
                     "width": metadata["width"],
                     "height": metadata["height"],
                 })
 
                 # Wait for layout to stabilize after viewport resize
-                await page_obj.wait_for_timeout(100)
-
-                # Take screenshot at exact rendered size
-                screenshot_data = await page_obj.screenshot(
-                    type=format if format != "webp" else "png",
-                    full_page=False,
-                )
-
-            await browser.close()
-
-            # Actual image size is viewport * deviceScaleFactor
-            actual_width = metadata["width"] * device_scale_factor
-            actual_height = metadata["height"] * device_scale_factor
+                await page_obj.evaluate(_WAIT_LAYOUT_JS)
 
-            return ScreenshotResult(
-                data=screenshot_data,
-                format=format,
-                width=actual_width,
-                height=actual_height,
-                renderer=file_format,
+            # Take screenshot at exact rendered size
+            screenshot_data = await _capture(
+                page_obj,
+                format,
+                full_page=False,
             )
 
-        except Exception:
-            await browser.close()
-            raise
+        # Actual image size is viewport * deviceScaleFactor
+        actual_width = metadata["width"] * device_scale_factor
+        actual_height = metadata["height"] * device_scale_factor
+
+        return ScreenshotResult(
+            data=screenshot_data,
+            format=format,
+            width=actual_width,
+            height=actual_height,
+            renderer=file_format,
+        )
 
 
 def screenshot(
-    input: Union[bytes, str],
+    input: Union[bytes, str, os.PathLike],
     input_format: str,
     *,
     format: ImageFormat = "png",
@@ -429,18 +1110,20 @@ def screenshot(
     height: Optional[int] = None,
     page: int = 1,
     file_name: Optional[str] = None,
+    device_scale_factor: int = 1,
 ) -> ScreenshotResult:
     """
     Convert input data to a screenshot image.
 
     Args:
-        input: Input data - bytes for documents, or URL string for 'url' format
+        input: Input data - bytes for documents, URL string for 'url' format, or a path to read the input from
         input_format: Input format as slug (e.g., 'pdf') or MIME type (e.g., 'application/pdf')
         format: Output image format ('png', 'jpeg', 'webp')
         width: Viewport width (optional, defaults to 800 or 1280 for URLs)
         height: Viewport height (optional, defaults to 600 or 800 for URLs)
         page: Page number for multi-page documents
         file_name: Optional filename hint for code format language detection
+        device_scale_factor: Device pixel ratio (2 for retina-quality output, at 4x the pixels to render and encode)
 
     Returns:
         ScreenshotResult with image data and dimensions
@@ -448,10 +1131,67 @@ def screenshot(
     Raises:
         ScreenitshotError: If conversion fails
     """
-    return asyncio.run(render_async(input, input_format, format=format, width=width, height=height, page=page, file_name=file_name))
+    # Runs on the persistent background loop, so the browser pool stays warm
+    # across calls
+    return _loop_thread.run(render_async(input, input_format, format=format, width=width, height=height, page=page, file_name=file_name, device_scale_factor=device_scale_factor))
+
+
+async def render_many(
+    jobs: list[dict[str, Any]],
+    concurrency: Optional[int] = None,
+) -> list[ScreenshotResult]:
+    """
+    Render several inputs concurrently on the shared browser pool.
+
+    Args:
+        jobs: Keyword arguments for render_async, one dict per screenshot
+            (e.g. {"input": data, "input_format": "pdf", "page": 2})
+        concurrency: Maximum renders in flight (defaults to the browser pool size)
+
+    Returns:
+        ScreenshotResults in the same order as jobs
+
+    Raises:
+        ScreenitshotError: If any conversion fails
+    """
+    semaphore = asyncio.Semaphore(concurrency or _pool.size)
+
+    async def _bounded(job: dict[str, Any]) -> ScreenshotResult:
+        async with semaphore:
+            return await render_async(**job)
+
+    tasks = [asyncio.create_task(_bounded(job)) for job in jobs]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def screenshot_many(
+    jobs: list[dict[str, Any]],
+    concurrency: Optional[int] = None,
+) -> list[ScreenshotResult]:
+    """
+    Convert several inputs to screenshot images, reusing one browser pool.
+
+    Args:
+        jobs: Keyword arguments for screenshot, one dict per screenshot
+            (e.g. {"input": data, "input_format": "pdf", "page": 2})
+        concurrency: Maximum renders in flight (defaults to the browser pool size)
+
+    Returns:
+        ScreenshotResults in the same order as jobs
+
+    Raises:
+        ScreenitshotError: If any conversion fails
+    """
+    return _loop_thread.run(render_many(jobs, concurrency))
 
 
 # Convenience function for async usage
 render = render_async
 
-__all__ = ["screenshot", "render", "ScreenshotResult", "ScreenitshotError", "ImageFormat", "FileFormat", "resolve_format", "detect_format"]
+__all__ = ["screenshot", "screenshot_many", "render", "render_many", "close_pool", "ScreenshotResult", "ScreenitshotError", "ImageFormat", "FileFormat", "resolve_format", "detect_format"]
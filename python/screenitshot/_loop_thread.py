@@ -0,0 +1,83 @@
+"""Persistent background event loop shared by all renders.
+
+The browser pool belongs to the event loop it was started on. Running every
+render on one long-lived loop in a daemon thread keeps the pool warm across
+sync screenshot() calls and lets render_async be awaited from any loop.
+"""
+
+import os
+import asyncio
+import threading
+import concurrent.futures
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background loop, starting its thread on first use"""
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="screenitshot-loop", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def _reset_after_fork() -> None:
+    # A forked child inherits the loop object but not the thread running it,
+    # so anything submitted to it would never run. Start over on next use.
+    global _loop, _lock
+    _loop = None
+    _lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def is_running() -> bool:
+    """Check whether the background loop has been started"""
+    return _loop is not None
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+    """Schedule a coroutine on the background loop without waiting for it"""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background loop and block until it finishes"""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+async def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Await a coroutine on the background loop from any event loop.
+
+    Cancelling the awaiting task cancels the coroutine on the background loop.
+    """
+    loop = get_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def stop(cleanup: Optional[Callable[[], Coroutine[Any, Any, Any]]] = None, timeout: float = 10) -> None:
+    """Run an optional cleanup coroutine, then stop the background loop"""
+    global _loop
+    with _lock:
+        loop, _loop = _loop, None
+    if loop is None:
+        return
+
+    if cleanup is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(cleanup(), loop).result(timeout)
+        except Exception:
+            pass
+    loop.call_soon_threadsafe(loop.stop)
@@ -1,16 +1,34 @@
 """Command-line interface for screenitshot"""
 
 import os
+import re
 import sys
+import glob
 import argparse
 from pathlib import Path
 from . import screenshot, detect_format, ScreenitshotError, __version__
 
+# Trailing " (N)" duplicate counter in an output file stem
+_COUNTER_RE = re.compile(r" \((\d+)\)$")
+
+
+def positive_int(value: str) -> int:
+    """argparse type for integers of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
 def get_unique_output_path(base_path: Path) -> Path:
     """Generate a unique output path using macOS-style duplicate naming.
 
-    If base_path exists, returns base_path with ' (1)', ' (2)', etc. suffix.
+    If base_path exists, returns base_path with a ' (N)' suffix, one past the
+    highest existing counter. Existing duplicates are found with a single
+    directory scan rather than probing each candidate name.
     Example: document.png -> document (1).png -> document (2).png
     """
     if not base_path.exists():
@@ -20,12 +38,14 @@ def get_unique_output_path(base_path: Path) -> Path:
     suffix = base_path.suffix
     parent = base_path.parent
 
-    counter = 1
-    while True:
-        new_path = parent / f"{stem} ({counter}){suffix}"
-        if not new_path.exists():
-            return new_path
-        counter += 1
+    pattern = f"{glob.escape(stem)} (*){glob.escape(suffix)}"
+    counters = (
+        int(m.group(1))
+        for p in parent.glob(pattern)
+        if (m := _COUNTER_RE.search(p.stem))
+    )
+    counter = max(counters, default=0) + 1
+    return parent / f"{stem} ({counter}){suffix}"
 
 
 def main():
@@ -57,6 +77,31 @@ def main():
         default=1,
         help="Page number for multi-page documents (default: 1)",
     )
+    parser.add_argument(
+        "--dsf",
+        dest="device_scale_factor",
+        type=positive_int,
+        default=1,
+        help="Device scale factor; 2 gives sharper output at 4x the pixels (default: 1)",
+    )
+    parser.add_argument(
+        "--retina",
+        dest="device_scale_factor",
+        action="store_const",
+        const=2,
+        help="Shorthand for --dsf 2",
+    )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Don't print status output",
+    )
+    verbosity.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print status output even when stdout is not a terminal",
+    )
     parser.add_argument(
         "-v", "--version",
         action="version",
@@ -83,31 +128,36 @@ def main():
         base_output = input_path.with_suffix(f".{args.format}")
         output_path = get_unique_output_path(base_output)
 
-        print(f"Converting {args.input}...")
+        # Status output is for interactive use; batch runs skip it
+        show_status = not args.quiet and (args.verbose or sys.stdout.isatty())
 
-        # Read input file
-        with open(input_path, "rb") as f:
-            input_data = f.read()
+        if show_status:
+            sys.stdout.write(f"Converting {args.input}...\n")
+            sys.stdout.flush()
 
-        # Call buffer-based API
+        # The file is read by the renderer, off its event loop
         result = screenshot(
-            input_data,
+            input_path,
             input_format,
             format=args.format,
             width=args.width,
             height=args.height,
             page=args.page,
             file_name=input_path.name,
+            device_scale_factor=args.device_scale_factor,
         )
 
         # Write output to file
         with open(output_path, "wb") as f:
             f.write(result.data)
 
-        print(f"✓ Screenshot saved to {output_path}")
-        print(f"  Renderer: {result.renderer}")
-        print(f"  Format: {result.format}")
-        print(f"  Size: {result.width}x{result.height}")
+        if show_status:
+            sys.stdout.write(
+                f"✓ Screenshot saved to {output_path}\n"
+                f"  Renderer: {result.renderer}\n"
+                f"  Format: {result.format}\n"
+                f"  Size: {result.width}x{result.height}\n"
+            )
     except ScreenitshotError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
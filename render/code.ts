@@ -1,7 +1,7 @@
 import { createHighlighter, type Highlighter, type BundledLanguage } from 'shiki';
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputText } from './input';
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Also inject filename for language detection
@@ -200,7 +200,7 @@ async function renderCode(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       // Return dummy metadata for local testing
       return {
@@ -218,13 +218,8 @@ async function renderCode(): Promise<RenderMetadata> {
     // Initialize highlighter
     const hl = await initHighlighter();
 
-    // Decode base64 to text
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
-    const code = new TextDecoder('utf-8').decode(bytes);
+    // Read input as text
+    const code = await readInputText(fileBase64);
 
     // Detect language from filename
     const language = getLanguageFromFilename(fileName);
@@ -1,7 +1,7 @@
 import Papa from 'papaparse';
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputText } from './input';
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -89,7 +89,7 @@ async function renderCSV(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       // Return dummy metadata for local testing
       return {
@@ -104,13 +104,8 @@ async function renderCSV(): Promise<RenderMetadata> {
     // Set container to fixed width for consistent rendering
     container.style.width = `${VIEWPORT_WIDTH}px`;
 
-    // Decode base64 to text
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
-    const csvText = new TextDecoder('utf-8').decode(bytes);
+    // Read input as text
+    const csvText = await readInputText(fileBase64);
 
     // Parse CSV using PapaParse
     const result = Papa.parse<string[]>(csvText, {
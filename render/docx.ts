@@ -1,7 +1,7 @@
 import { renderAsync } from 'docx-preview';
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputBytes } from './input';
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -82,7 +82,7 @@ async function renderDOCX(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       // Return dummy metadata for local testing
       return {
@@ -94,12 +94,8 @@ async function renderDOCX(): Promise<RenderMetadata> {
       };
     }
 
-    // Convert base64 to Blob (docx-preview accepts Blob)
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
+    // Read input and convert to Blob (docx-preview accepts Blob)
+    const bytes = await readInputBytes(fileBase64);
     const blob = new Blob([bytes], { type: 'application/vnd.openxmlformats-officedocument.wordprocessingml.document' });
 
     // Set container to fixed width for consistent rendering
@@ -1,7 +1,7 @@
 import ePub from 'epubjs';
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputBytes } from './input';
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -80,7 +80,7 @@ async function renderEPUB(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       // Return dummy metadata for local testing
       return {
@@ -92,12 +92,8 @@ async function renderEPUB(): Promise<RenderMetadata> {
       };
     }
 
-    // Convert base64 to ArrayBuffer
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
+    // Read input and convert to ArrayBuffer
+    const bytes = await readInputBytes(fileBase64);
     const arrayBuffer = bytes.buffer;
 
     const scale = 2.0; // 2x scale for high quality output
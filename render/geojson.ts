@@ -1,6 +1,7 @@
 import maplibregl, { LngLatBounds } from 'maplibre-gl';
 import 'maplibre-gl/dist/maplibre-gl.css';
 import type { RenderMetadata } from '../js/src/types';
+import { readInputText } from './input';
 
 declare global {
   interface Window {
@@ -84,8 +85,8 @@ function getBounds(geojson: GeoJSONData): LngLatBounds {
 }
 
 async function render(): Promise<RenderMetadata> {
-  // Decode base64 file content
-  const content = atob(globalThis.fileBase64);
+  // Read file content
+  const content = await readInputText(globalThis.fileBase64);
   const geojson: GeoJSONData = JSON.parse(content);
 
   const mapContainer = document.getElementById('map');
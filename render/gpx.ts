@@ -2,6 +2,7 @@ import maplibregl, { LngLatBounds } from 'maplibre-gl';
 import 'maplibre-gl/dist/maplibre-gl.css';
 import { gpx } from '@tmcw/togeojson';
 import type { RenderMetadata } from '../js/src/types';
+import { readInputText } from './input';
 
 declare global {
   interface Window {
@@ -62,8 +63,8 @@ function getBounds(geojson: GeoJSON.FeatureCollection): LngLatBounds {
 }
 
 async function render(): Promise<RenderMetadata> {
-  // Decode base64 file content
-  const content = atob(globalThis.fileBase64);
+  // Read file content
+  const content = await readInputText(globalThis.fileBase64);
 
   // Parse GPX XML
   const parser = new DOMParser();
@@ -1,5 +1,5 @@
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputText } from './input';
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -80,7 +80,7 @@ async function renderHTML(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       // Return dummy metadata for local testing
       return {
@@ -92,13 +92,8 @@ async function renderHTML(): Promise<RenderMetadata> {
       };
     }
 
-    // Decode base64 to text
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
-    const htmlContent = new TextDecoder('utf-8').decode(bytes);
+    // Read input as text
+    const htmlContent = await readInputText(fileBase64);
 
     // Parse HTML content
     const parser = new DOMParser();
@@ -0,0 +1,66 @@
+// Input loading shared by all templates
+//
+// Renderers hand the input file to a template in one of these ways:
+// - globalThis.fileUrl: URL serving the raw file bytes. The Python binding
+//   fulfills it from memory via Playwright request interception, so the file
+//   never goes through base64.
+// - globalThis.fileText: file content as a string, for text formats (JS binding).
+// - globalThis.fileBase64: base64-encoded file content (JS binding).
+// With none set, templates fall back to local testing mode.
+
+export const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
+
+function getFileUrl(): string | undefined {
+  return (globalThis as any).fileUrl;
+}
+
+function getFileText(): string | undefined {
+  return (globalThis as any).fileText;
+}
+
+// Check whether input was injected (or selected in local testing mode)
+export function hasInput(fileBase64: string | undefined): boolean {
+  return (!!fileBase64 && fileBase64 !== FILE_BASE64_PLACEHOLDER)
+    || getFileText() !== undefined
+    || !!getFileUrl();
+}
+
+// Read input as raw bytes, preferring base64 data when present
+export async function readInputBytes(fileBase64: string | undefined): Promise<Uint8Array> {
+  if (fileBase64 && fileBase64 !== FILE_BASE64_PLACEHOLDER) {
+    const binaryString = atob(fileBase64);
+    const bytes = new Uint8Array(binaryString.length);
+    for (let i = 0; i < binaryString.length; i++) {
+      bytes[i] = binaryString.charCodeAt(i);
+    }
+    return bytes;
+  }
+
+  const fileText = getFileText();
+  if (fileText !== undefined) {
+    return new TextEncoder().encode(fileText);
+  }
+
+  const fileUrl = getFileUrl();
+  if (!fileUrl) {
+    throw new Error('No input provided');
+  }
+
+  const response = await fetch(fileUrl);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch input: ${response.status} ${response.statusText}`);
+  }
+  return new Uint8Array(await response.arrayBuffer());
+}
+
+// Read input as UTF-8 text
+export async function readInputText(fileBase64: string | undefined): Promise<string> {
+  // Text injected as-is skips the encode/decode round-trip
+  const fileText = getFileText();
+  if (fileText !== undefined && !(fileBase64 && fileBase64 !== FILE_BASE64_PLACEHOLDER)) {
+    return fileText;
+  }
+
+  const bytes = await readInputBytes(fileBase64);
+  return new TextDecoder('utf-8').decode(bytes);
+}
@@ -1,8 +1,8 @@
 import { marked } from 'marked';
 import { createHighlighter, type Highlighter } from 'shiki';
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputText } from './input';
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -307,7 +307,7 @@ async function renderNotebook(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       // Return dummy metadata for local testing
       return {
@@ -328,13 +328,8 @@ async function renderNotebook(): Promise<RenderMetadata> {
     // Initialize highlighter
     const hl = await initHighlighter();
 
-    // Decode base64 to text
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
-    const notebookJson = new TextDecoder('utf-8').decode(bytes);
+    // Read input as text
+    const notebookJson = await readInputText(fileBase64);
 
     // Parse notebook JSON
     const notebook: NotebookData = JSON.parse(notebookJson);
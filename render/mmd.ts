@@ -1,5 +1,6 @@
 import mermaid from 'mermaid';
 import type { RenderMetadata } from '../js/src/types';
+import { readInputText } from './input';
 
 declare global {
   interface Window {
@@ -10,8 +11,8 @@ declare global {
 }
 
 async function render(): Promise<RenderMetadata> {
-  // Decode base64 file content
-  const mmdContent = atob(globalThis.fileBase64);
+  // Read file content
+  const mmdContent = await readInputText(globalThis.fileBase64);
 
   // Initialize mermaid with configuration
   mermaid.initialize({
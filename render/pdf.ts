@@ -1,11 +1,11 @@
 import * as pdfjsLib from 'pdfjs-dist';
 import workerSrc from 'pdfjs-dist/build/pdf.worker.min.mjs?url';
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputBytes } from './input';
 
 // Set worker path (bundled locally by Vite)
 pdfjsLib.GlobalWorkerOptions.workerSrc = workerSrc;
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -82,7 +82,7 @@ async function renderPDF(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       // Return dummy metadata for local testing
       return {
@@ -94,12 +94,8 @@ async function renderPDF(): Promise<RenderMetadata> {
       };
     }
 
-    // Convert base64 to Uint8Array
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
+    // Read input bytes
+    const bytes = await readInputBytes(fileBase64);
 
     const loadingTask = pdfjsLib.getDocument({ data: bytes });
     const pdf = await loadingTask.promise;
@@ -1,7 +1,7 @@
 import { RTFJS, WMFJS, EMFJS } from 'rtf.js';
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputBytes } from './input';
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -74,16 +74,6 @@ function showFileSelector() {
   });
 }
 
-// Convert string to ArrayBuffer
-function stringToArrayBuffer(str: string): ArrayBuffer {
-  const buffer = new ArrayBuffer(str.length);
-  const bufferView = new Uint8Array(buffer);
-  for (let i = 0; i < str.length; i++) {
-    bufferView[i] = str.charCodeAt(i);
-  }
-  return buffer;
-}
-
 // Viewport constants for pseudo-pagination
 const VIEWPORT_WIDTH = 960;
 const VIEWPORT_HEIGHT = 1280;
@@ -97,7 +87,7 @@ async function renderRTF(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       // Return dummy metadata for local testing
       return {
@@ -112,11 +102,11 @@ async function renderRTF(): Promise<RenderMetadata> {
     // Set container to fixed width for consistent rendering
     container.style.width = `${VIEWPORT_WIDTH}px`;
 
-    // Decode base64 to binary string
-    const binaryString = atob(fileBase64);
+    // Read input bytes
+    const bytes = await readInputBytes(fileBase64);
 
     // Convert to ArrayBuffer for rtf.js
-    const arrayBuffer = stringToArrayBuffer(binaryString);
+    const arrayBuffer = bytes.buffer;
 
     // Create RTF document and render
     const doc = new RTFJS.Document(arrayBuffer);
@@ -1,7 +1,7 @@
 import { parse, HtmlGenerator } from 'latex.js';
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputText } from './input';
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -82,7 +82,7 @@ async function renderLaTeX(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       // Return dummy metadata for local testing
       return {
@@ -97,13 +97,8 @@ async function renderLaTeX(): Promise<RenderMetadata> {
     // Set container to fixed width for consistent rendering
     container.style.width = `${VIEWPORT_WIDTH}px`;
 
-    // Decode base64 to text
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
-    const latexSource = new TextDecoder('utf-8').decode(bytes);
+    // Read input as text
+    const latexSource = await readInputText(fileBase64);
 
     // Parse and generate HTML
     const generator = new HtmlGenerator({ hyphenate: false });
@@ -1,8 +1,8 @@
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputText } from './input';
 // URL format is special - it navigates directly to the URL instead of using a template
 // This file is mainly for local testing mode
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -62,7 +62,7 @@ async function renderURL(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showUrlInput();
       // Return dummy metadata for local testing
       return {
@@ -78,13 +78,8 @@ async function renderURL(): Promise<RenderMetadata> {
     // The renderer navigates directly to the URL
     // This code is here just for consistency
 
-    // Decode base64 to text (URL string)
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
-    const url = new TextDecoder('utf-8').decode(bytes).trim();
+    // Read input as text (URL string)
+    const url = (await readInputText(fileBase64)).trim();
 
     container.innerHTML = `
       <p>URL to screenshot: ${url}</p>
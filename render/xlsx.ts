@@ -1,7 +1,7 @@
 import ExcelJS from 'exceljs';
+import { FILE_BASE64_PLACEHOLDER, hasInput, readInputBytes } from './input';
 
 // Placeholder values - will be injected by Playwright before page loads
-const FILE_BASE64_PLACEHOLDER = 'FILE_BASE64_PLACEHOLDER';
 const PAGE_NUMBER_PLACEHOLDER = 1;
 
 // Check if values were injected via Playwright, otherwise use placeholders
@@ -240,7 +240,7 @@ async function renderXLSX(): Promise<RenderMetadata> {
     }
 
     // Check if placeholder value (local testing mode)
-    if (fileBase64 === FILE_BASE64_PLACEHOLDER) {
+    if (!hasInput(fileBase64)) {
       showFileSelector();
       return {
         width: 1280,
@@ -251,12 +251,8 @@ async function renderXLSX(): Promise<RenderMetadata> {
       };
     }
 
-    // Convert base64 to ArrayBuffer
-    const binaryString = atob(fileBase64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
+    // Read input and convert to ArrayBuffer
+    const bytes = await readInputBytes(fileBase64);
 
     // Load workbook
     const workbook = new ExcelJS.Workbook();